@@ -4,8 +4,10 @@ import os
 import json
 import argparse
 import re
+import logging
 from notion_client import Client, APIResponseError
 from md_to_blocks import convert_markdown_to_notion_blocks
+from notion_utils import extract_id_from_url, extract_url_from_markdown
 
 # Notion APIキーを環境変数から取得
 NOTION_TOKEN = os.environ.get("NOTION_TOKEN")
@@ -30,10 +32,6 @@ def load_config():
         print(f"警告: config.jsonが見つかりません。デフォルト設定を使用します。")
         return {}
 
-def extract_id_from_url(url: str) -> str:
-    match = re.search(r"([a-f0-9]{32}|[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12})", url)
-    return match.group(1).replace("-", "") if match else None
-
 def clear_page_content(page_id: str):
     # ページの子ブロックをすべて取得
     blocks = notion.blocks.children.list(block_id=page_id)
@@ -97,13 +95,9 @@ def create_or_update_notion_page(title: str, blocks: list, url: str, title_colum
         notion.blocks.children.append(block_id=new_page["id"], children=blocks)
         return new_page["url"]
 
-def extract_url_from_markdown(markdown_content: str) -> str:
-    url_match = re.search(r"//url:(https://www\.notion\.so/[^\s]+)", markdown_content)
-    if url_match:
-        return url_match.group(1)
-    return None
-
 def main():
+    # md_to_blocks の警告を notion2md.py と同じ形式で表示する
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     print("スクリプトを開始します")
     config = load_config()
     default_parent_url = config.get('default_parent_url', '')
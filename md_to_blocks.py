@@ -2,18 +2,19 @@ import re
 from typing import List, Dict, Any, Tuple
 import json
 import sys
+import logging
 
 def convert_markdown_to_notion_blocks(markdown: str) -> List[Dict[str, Any]]:
-    print("convert_markdown_to_notion_blocks 関数を開始します")
+    logging.debug("convert_markdown_to_notion_blocks 関数を開始します")
     try:
         blocks = []
         lines = markdown.split('\n')
-        print(f"行数: {len(lines)}")
+        logging.debug(f"行数: {len(lines)}")
         
         i = 0
         while i < len(lines):
             line = lines[i].strip()
-            print(f"処理中の行: {i + 1}")
+            logging.debug(f"処理中の行: {i + 1}")
             
             if not line:
                 i += 1
@@ -21,7 +22,7 @@ def convert_markdown_to_notion_blocks(markdown: str) -> List[Dict[str, Any]]:
             
             # ヘッダー
             if line.startswith('#'):
-                print("ヘッダーを処理します")
+                logging.debug("ヘッダーを処理します")
                 level = len(line.split()[0])
                 content = line.lstrip('#').strip()
                 blocks.append({
@@ -34,11 +35,11 @@ def convert_markdown_to_notion_blocks(markdown: str) -> List[Dict[str, Any]]:
             
             # リスト（箇条書きと番���
             elif line.lstrip().startswith('- ') or line.lstrip().startswith('* ') or re.match(r'^\s*\d+\.', line):
-                print("リストを処理します")
+                logging.debug("リストを処理します")
                 list_items, new_i = process_list_items(lines, i)
                 blocks.extend(list_items)
                 if new_i <= i:
-                    print(f"警告: リスト処理でインデックスが進みませんでした。強制的に次の行に進みます。")
+                    logging.warning("リスト処理でインデックスが進みませんでした。強制的に次の行に進みます。")
                     i += 1
                 else:
                     i = new_i
@@ -46,7 +47,7 @@ def convert_markdown_to_notion_blocks(markdown: str) -> List[Dict[str, Any]]:
             
             # コードブロック
             elif line.startswith('```'):
-                print("コードブロックを処理します")
+                logging.debug("コードブロックを処理します")
                 language = line[3:].strip() or "plain_text"
                 code_lines = []
                 i += 1
@@ -65,7 +66,7 @@ def convert_markdown_to_notion_blocks(markdown: str) -> List[Dict[str, Any]]:
             
             # 水平線
             elif line == '---' or line == '***' or line == '___':
-                print("水平線を処理します")
+                logging.debug("水平線を処理します")
                 blocks.append({
                     "object": "block",
                     "type": "divider",
@@ -74,7 +75,7 @@ def convert_markdown_to_notion_blocks(markdown: str) -> List[Dict[str, Any]]:
             
             # テーブル
             elif '|' in line:
-                print("テーブルを処理します")
+                logging.debug("テーブルを処理します")
                 table_rows = []
                 while i < len(lines) and '|' in lines[i]:
                     table_rows.append(lines[i])
@@ -88,7 +89,7 @@ def convert_markdown_to_notion_blocks(markdown: str) -> List[Dict[str, Any]]:
             
             # 通常のテキスト
             else:
-                print("段落を処理します")
+                logging.debug("段落を処理します")
                 try:
                     blocks.append({
                         "object": "block",
@@ -98,16 +99,14 @@ def convert_markdown_to_notion_blocks(markdown: str) -> List[Dict[str, Any]]:
                         }
                     })
                 except ValueError as e:
-                    print(f"警告: {e}. 行をスキップします: {line}")
+                    logging.warning(f"{e}. 行をスキップします: {line}")
             
             i += 1
         
-        print("すべての行の処理が完了しました")
+        logging.debug("すべての行の処理が完了しました")
         return blocks
     except Exception as e:
-        print(f"Markdownの変換中にエラーが発生しました: {e}")
-        import traceback
-        traceback.print_exc()
+        logging.exception(f"Markdownの変換中にエラーが発生しました: {e}")
         raise
 
 def parse_inline_formatting(text: str) -> Dict[str, Any]:
@@ -185,7 +184,7 @@ def process_table(table_rows: List[str]) -> Dict[str, Any]:
     }
 
 def process_list_items(lines: List[str], start_index: int) -> Tuple[List[Dict[str, Any]], int]:
-    print(f"process_list_items 関数を開始します。開始インデックス: {start_index}")
+    logging.debug(f"process_list_items 関数を開始します。開始インデックス: {start_index}")
     list_items = []
     current_indent = 0
     stack = []
@@ -193,7 +192,7 @@ def process_list_items(lines: List[str], start_index: int) -> Tuple[List[Dict[st
 
     while i < len(lines):
         line = lines[i].rstrip()
-        print(f"  処理中のリスト行: {i + 1}")
+        logging.debug(f"  処理中のリスト行: {i + 1}")
         if not line or (not line.lstrip().startswith('- ') and not line.lstrip().startswith('* ') and not re.match(r'^\s*\d+\.', line)):
             break
 
@@ -232,7 +231,7 @@ def process_list_items(lines: List[str], start_index: int) -> Tuple[List[Dict[st
 
         i += 1
 
-    print(f"process_list_items 関数を終了します。終了インデックス: {i}")
+    logging.debug(f"process_list_items 関数を終了します。終了インデックス: {i}")
     return list_items, i
 
 def main():
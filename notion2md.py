@@ -7,6 +7,7 @@ from notion_client import Client, APIResponseError
 from typing import List, Dict, Any
 import re
 import logging
+from notion_utils import extract_id_from_url, block_to_markdown, text_to_markdown
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -28,10 +29,6 @@ def load_config():
         logging.warning("config.jsonが見つかりません。デフォルト設定を使用します。")
         return {}
 
-def extract_id_from_url(url: str) -> str:
-    match = re.search(r"([a-f0-9]{32}|[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12})", url)
-    return match.group(1).replace("-", "") if match else None
-
 def get_block_children(block_id: str, start_cursor: str = None) -> Dict[str, Any]:
     return notion.blocks.children.list(block_id=block_id, start_cursor=start_cursor)
 
@@ -48,55 +45,6 @@ def get_page_content(page_id: str) -> List[Dict[str, Any]]:
 
     return blocks
 
-def block_to_markdown(block: Dict[str, Any], depth: int = 0) -> str:
-    block_type = block["type"]
-    indent = "  " * depth
-
-    if block_type == "paragraph":
-        return f"{indent}{text_to_markdown(block['paragraph']['rich_text'])}\n"
-    elif block_type.startswith("heading_"):
-        level = int(block_type[-1])
-        return f"{indent}{'#' * level} {text_to_markdown(block[block_type]['rich_text'])}\n"
-    elif block_type == "to_do":
-        checked = "x" if block["to_do"]["checked"] else " "
-        return f"{indent}- [{checked}] {text_to_markdown(block['to_do']['rich_text'])}\n"
-    elif block_type == "code":
-        language = block["code"]["language"]
-        code = text_to_markdown(block["code"]["rich_text"])
-        return f"{indent}```{language}\n{code}\n```\n"
-    elif block_type == "quote":
-        return f"{indent}> {text_to_markdown(block['quote']['rich_text'])}\n"
-    elif block_type == "divider":
-        return f"{indent}---\n"
-    elif block_type == "image":
-        caption = text_to_markdown(block["image"].get("caption", []))
-        url = block["image"]["file"]["url"]
-        return f"{indent}![{caption}]({url})\n"
-    elif block_type in ["numbered_list_item", "bulleted_list_item"]:
-        if block_type == "numbered_list_item":
-            return f"{indent}1. {text_to_markdown(block[block_type]['rich_text'])}\n"
-        else:
-            return f"{indent}- {text_to_markdown(block[block_type]['rich_text'])}\n"
-    else:
-        return ""
-
-def text_to_markdown(rich_text: List[Dict[str, Any]]) -> str:
-    markdown = ""
-    for text in rich_text:
-        content = text["plain_text"]
-        if text.get("href"):
-            content = f"[{content}]({text['href']})"
-        if text["annotations"]["bold"]:
-            content = f"**{content}**"
-        if text["annotations"]["italic"]:
-            content = f"*{content}*"
-        if text["annotations"]["strikethrough"]:
-            content = f"~~{content}~~"
-        if text["annotations"]["code"]:
-            content = f"`{content}`"
-        markdown += content
-    return markdown
-
 def get_page_title(page_id: str) -> str:
     try:
         page = notion.pages.retrieve(page_id)
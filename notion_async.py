@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+
+import os
+import re
+import asyncio
+import logging
+from typing import List, Dict, Any, Optional
+from notion_client import AsyncClient, APIResponseError
+from md_to_blocks import convert_markdown_to_notion_blocks
+from notion_utils import block_to_markdown, extract_id_from_url, extract_url_from_markdown
+
+# asyncioアプリケーションから notion2md / md2notion の処理を呼び出すためのライブラリAPI
+#
+#   async with AsyncNotion(auth=token, max_concurrency=3) as notion:
+#       markdown = await notion.pull_page(url, output_dir="docs")
+#       page_url = await notion.push_markdown(markdown, title="仕様書")
+#
+# 1つのインスタンスが1つの AsyncClient（コネクションプール）を共有し、
+# Notion APIへの同時リクエスト数は max_concurrency で制限されます。
+
+
+class AsyncNotion:
+    def __init__(self, auth: Optional[str] = None, max_concurrency: int = 3, client: Optional[AsyncClient] = None):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self._owns_client = client is None
+        self.client = client or AsyncClient(auth=auth or os.environ.get("NOTION_TOKEN"))
+        self.max_concurrency = max_concurrency
+        # Python 3.9以前ではイベントループ外で作成したSemaphoreが別ループに紐付くため、
+        # 最初のリクエスト時に実行中のループ内で作成する
+        self._semaphore = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def aclose(self):
+        # 呼び出し側から渡されたクライアントは閉じない
+        if self._owns_client:
+            await self.client.aclose()
+
+    async def _request(self, method, **kwargs) -> Dict[str, Any]:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            return await method(**kwargs)
+
+    # --- Notion -> Markdown ---
+
+    async def get_page_content(self, page_id: str) -> List[Dict[str, Any]]:
+        blocks = []
+        start_cursor = None
+
+        while True:
+            response = await self._request(self.client.blocks.children.list, block_id=page_id, start_cursor=start_cursor)
+            blocks.extend(response["results"])
+            if not response["has_more"]:
+                break
+            start_cursor = response["next_cursor"]
+
+        return blocks
+
+    async def get_database_entries(self, database_id: str) -> List[Dict[str, Any]]:
+        results = []
+        has_more = True
+        next_cursor = None
+        while has_more:
+            response = await self._request(self.client.databases.query, database_id=database_id, start_cursor=next_cursor)
+            results.extend(response["results"])
+            has_more = response["has_more"]
+            next_cursor = response["next_cursor"]
+        return results
+
+    async def process_blocks(self, blocks: List[Dict[str, Any]], depth: int = 0) -> str:
+        # 子ブロックを持つブロックは並行して取得し、元の順序で結合する
+        children = await _gather_or_cancel([
+            self._process_children(block["id"], depth + 1) if block.get("has_children") else _empty()
+            for block in blocks
+        ])
+
+        markdown = ""
+        for block, child_markdown in zip(blocks, children):
+            markdown += block_to_markdown(block, depth)
+            markdown += child_markdown
+
+        return markdown
+
+    async def _process_children(self, block_id: str, depth: int) -> str:
+        child_blocks = await self.get_page_content(block_id)
+        return await self.process_blocks(child_blocks, depth)
+
+    async def pull_page(self, url: str, output_dir: Optional[str] = None, fetch_children: bool = False) -> str:
+        """NotionページまたはデータベースをMarkdownに変換して返す。
+
+        output_dir を指定した場合は notion2md.py と同じ形式でファイルにも書き出す。
+        fetch_children=True の場合は子ページも output_dir 以下に書き出すため、
+        output_dir の指定が必須（未指定の場合は ValueError）。
+        """
+        if fetch_children and not output_dir:
+            raise ValueError("output_dir is required when fetch_children is set")
+
+        page_id = extract_id_from_url(url)
+        if not page_id:
+            raise ValueError("Invalid Notion URL provided")
+
+        try:
+            page = await self._request(self.client.pages.retrieve, page_id=page_id)
+            is_database = False
+        except APIResponseError:
+            page = await self._request(self.client.databases.retrieve, database_id=page_id)
+            is_database = True
+
+        page_title = _get_title(page, is_database)
+        safe_title = re.sub(r'[<>:"/\\|?*]', '_', page_title)
+
+        markdown = f"# {page_title}\n\n"
+        if is_database:
+            entries = await self.get_database_entries(page_id)
+            for entry in entries:
+                entry_title = entry["properties"].get("Name", {}).get("title", [{}])[0].get("plain_text", "Untitled")
+                entry_id = entry["id"]
+                markdown += f"- [{entry_title}](https://www.notion.so/{entry_id.replace('-', '')})\n"
+            child_ids = [entry["id"] for entry in entries]
+        else:
+            blocks = await self.get_page_content(page_id)
+            markdown += await self.process_blocks(blocks)
+            child_ids = [b["id"] for b in blocks if b["type"] == "child_page"]
+        markdown += f"\n\n//url:https://www.notion.so/{page_id}"
+
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+            output_file = os.path.join(output_dir, f"{safe_title}.md")
+            with open(output_file, "w", encoding="utf-8") as f:
+                f.write(markdown)
+            logging.info(f"Markdownファイルが作成されました: {output_file}")
+
+            if fetch_children and child_ids:
+                child_output_dir = os.path.join(output_dir, safe_title)
+                await _gather_or_cancel([
+                    self.pull_page(child_id, child_output_dir, fetch_children)
+                    for child_id in child_ids
+                ])
+
+        return markdown
+
+    # --- Markdown -> Notion ---
+
+    async def clear_page_content(self, page_id: str):
+        blocks = await self.get_page_content(page_id)
+        await _gather_or_cancel([
+            self._request(self.client.blocks.update, block_id=block["id"], archived=True)
+            for block in blocks
+        ])
+
+    async def create_or_update_notion_page(self, title: str, blocks: list, url: str, title_column: str = "名前", update_mode: bool = False) -> str:
+        page_id = extract_id_from_url(url)
+        if not page_id:
+            raise ValueError("Invalid Notion URL provided")
+
+        if update_mode:
+            await self._request(self.client.pages.update, page_id=page_id, properties={"title": {"title": [{"text": {"content": title}}]}})
+            await self.clear_page_content(page_id)
+            await self._request(self.client.blocks.children.append, block_id=page_id, children=blocks)
+            page = await self._request(self.client.pages.retrieve, page_id=page_id)
+            return page["url"]
+
+        try:
+            await self._request(self.client.databases.retrieve, database_id=page_id)
+            is_database = True
+        except APIResponseError as e:
+            if e.code == "object_not_found":
+                try:
+                    await self._request(self.client.pages.retrieve, page_id=page_id)
+                    is_database = False
+                except APIResponseError as e:
+                    raise ValueError(f"Invalid parent URL: {str(e)}")
+            else:
+                raise ValueError(f"APIエラー: {str(e)}")
+
+        if is_database:
+            parent = {"database_id": page_id}
+            properties = {title_column: {"title": [{"text": {"content": title}}]}}
+        else:
+            parent = {"page_id": page_id}
+            properties = {"title": {"title": [{"text": {"content": title}}]}}
+
+        new_page = await self._request(self.client.pages.create, parent=parent, properties=properties)
+        await self._request(self.client.blocks.children.append, block_id=new_page["id"], children=blocks)
+        return new_page["url"]
+
+    async def push_markdown(self, markdown_content: str, title: str, parent_url: Optional[str] = None, title_column: str = "名前") -> str:
+        """MarkdownをNotionにアップロードし、ページのURLを返す。
+
+        md2notion.py と同様に、末尾に //url:xxxx がある場合はそのページを更新し、
+        ない場合は parent_url の下に新しいページを作成する。
+        """
+        update_url = extract_url_from_markdown(markdown_content)
+        if update_url:
+            url = update_url
+            update_mode = True
+        else:
+            if not parent_url:
+                raise ValueError("Parent page or database URL is required")
+            url = parent_url
+            update_mode = False
+
+        markdown_content = re.sub(r"\n//url:https://www\.notion\.so/[^\s]+", "", markdown_content)
+        blocks = convert_markdown_to_notion_blocks(markdown_content)
+        return await self.create_or_update_notion_page(title, blocks, url, title_column, update_mode=update_mode)
+
+
+async def _empty() -> str:
+    return ""
+
+
+async def _gather_or_cancel(coros) -> list:
+    # asyncio.gather と同じく結果を順序通りに返すが、1つでも失敗した場合は
+    # 残りのリクエストをキャンセルし、完了を待ってから例外を送出する
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+def _get_title(obj: Dict[str, Any], is_database: bool) -> str:
+    # pages.retrieve / databases.retrieve のレスポンスからタイトルを取り出す
+    if is_database:
+        title = obj.get("title")
+    else:
+        title = next((prop["title"] for prop in obj["properties"].values() if prop["type"] == "title"), None)
+    return title[0]["plain_text"] if title else "Untitled"
+
+
+async def pull_page(url: str, output_dir: Optional[str] = None, fetch_children: bool = False, auth: Optional[str] = None, max_concurrency: int = 3) -> str:
+    async with AsyncNotion(auth=auth, max_concurrency=max_concurrency) as notion:
+        return await notion.pull_page(url, output_dir, fetch_children)
+
+
+async def push_markdown(markdown_content: str, title: str, parent_url: Optional[str] = None, title_column: str = "名前", auth: Optional[str] = None, max_concurrency: int = 3) -> str:
+    async with AsyncNotion(auth=auth, max_concurrency=max_concurrency) as notion:
+        return await notion.push_markdown(markdown_content, title, parent_url, title_column)
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+
+# notion_async.py のスモークテスト（Notion APIには接続しない）
+#   python -m unittest test_notion_async
+
+import os
+import sys
+import types
+import asyncio
+import tempfile
+import unittest
+
+try:
+    import notion_client  # noqa: F401
+except ImportError:
+    # notion-client 未インストール環境でも実行できるよう最小限のスタブを登録する
+    stub = types.ModuleType("notion_client")
+    stub.AsyncClient = object
+    stub.APIResponseError = type("APIResponseError", (Exception,), {})
+    sys.modules["notion_client"] = stub
+
+from notion_client import APIResponseError
+from notion_async import AsyncNotion
+
+PAGE_ID = "0" * 32
+DATABASE_ID = "1" * 32
+
+
+def _not_found() -> APIResponseError:
+    # 実際の APIResponseError はHTTPレスポンスを要求するため、code だけを設定して生成する
+    error = APIResponseError.__new__(APIResponseError)
+    Exception.__init__(error, "Could not find object")
+    error.code = "object_not_found"
+    return error
+
+
+def _paragraph(block_id: str, text: str, has_children: bool = False):
+    return {
+        "id": block_id,
+        "type": "paragraph",
+        "has_children": has_children,
+        "paragraph": {"rich_text": [{
+            "plain_text": text,
+            "annotations": {"bold": False, "italic": False, "strikethrough": False, "code": False},
+        }]},
+    }
+
+
+class FakeClient:
+    """ページ直下に子ブロックを持つ段落を並べ、子ブロックの取得ほど遅く返すクライアント。
+
+    PAGE_ID はページ、DATABASE_ID はデータベースとして扱い、更新系の呼び出しは calls に記録する。
+    """
+
+    def __init__(self, count: int, fail_block: str = None, page_size: int = 100):
+        self.count = count
+        self.fail_block = fail_block
+        self.page_size = page_size
+        self.in_flight = 0
+        self.peak = 0
+        self.closed = False
+        self.calls = []
+        self.pages = types.SimpleNamespace(
+            retrieve=self._retrieve_page,
+            create=self._recorder("pages.create", {"id": "new", "url": "https://www.notion.so/new"}),
+            update=self._recorder("pages.update", {}),
+        )
+        self.databases = types.SimpleNamespace(retrieve=self._retrieve_database)
+        self.blocks = types.SimpleNamespace(
+            update=self._recorder("blocks.update", {}),
+            children=types.SimpleNamespace(
+                list=self._list_children,
+                append=self._recorder("blocks.children.append", {}),
+            ),
+        )
+
+    def _recorder(self, name: str, result):
+        async def method(**kwargs):
+            self.calls.append((name, kwargs))
+            return await self._call(result)
+        return method
+
+    def called(self, name: str) -> list:
+        return [kwargs for call_name, kwargs in self.calls if call_name == name]
+
+    async def _call(self, result, delay: float = 0.0):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(delay)
+            if isinstance(result, Exception):
+                raise result
+            return result
+        finally:
+            self.in_flight -= 1
+
+    async def _retrieve_page(self, page_id):
+        if page_id != PAGE_ID:
+            return await self._call(_not_found())
+        return await self._call({
+            "url": f"https://www.notion.so/{PAGE_ID}",
+            "properties": {"title": {"type": "title", "title": [{"plain_text": "Title"}]}},
+        })
+
+    async def _retrieve_database(self, database_id):
+        if database_id != DATABASE_ID:
+            return await self._call(_not_found())
+        return await self._call({"title": [{"plain_text": "Database"}]})
+
+    async def _list_children(self, block_id, start_cursor=None):
+        if block_id == PAGE_ID:
+            start = int(start_cursor or 0)
+            end = min(start + self.page_size, self.count)
+            results = [_paragraph(f"p{i}", f"parent {i}", has_children=True) for i in range(start, end)]
+            has_more = end < self.count
+            return await self._call({"results": results, "has_more": has_more, "next_cursor": str(end) if has_more else None})
+        if block_id == self.fail_block:
+            return await self._call(RuntimeError("boom"))
+        # 先頭のブロックの子ほど応答を遅らせ、完了順と表示順をずらす
+        index = int(block_id[1:])
+        results = [_paragraph(f"c{index}", f"child {index}")]
+        return await self._call({"results": results, "has_more": False, "next_cursor": None}, delay=0.01 * (self.count - index))
+
+    async def aclose(self):
+        self.closed = True
+
+
+class AsyncNotionTest(unittest.TestCase):
+    def test_pull_page_keeps_block_order(self):
+        client = FakeClient(count=5)
+        markdown = asyncio.run(AsyncNotion(client=client, max_concurrency=5).pull_page(PAGE_ID))
+        lines = [line for line in markdown.splitlines() if line.strip()]
+        expected = ["# Title"]
+        for i in range(5):
+            expected += [f"parent {i}", f"  child {i}"]
+        self.assertEqual(lines[:-1], expected)
+
+    def test_max_concurrency_caps_in_flight_requests(self):
+        client = FakeClient(count=8)
+        asyncio.run(AsyncNotion(client=client, max_concurrency=2).pull_page(PAGE_ID))
+        self.assertEqual(client.peak, 2)
+
+    def test_caller_supplied_client_is_not_closed(self):
+        client = FakeClient(count=1)
+
+        async def run():
+            async with AsyncNotion(client=client) as notion:
+                await notion.pull_page(PAGE_ID)
+
+        asyncio.run(run())
+        self.assertFalse(client.closed)
+
+    def test_failed_request_cancels_sibling_requests(self):
+        client = FakeClient(count=5, fail_block="p4")
+
+        async def run():
+            with self.assertRaises(RuntimeError):
+                await AsyncNotion(client=client, max_concurrency=5).pull_page(PAGE_ID)
+            return client.in_flight
+
+        self.assertEqual(asyncio.run(run()), 0)
+
+    def test_pull_page_creates_missing_output_dir(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            output_dir = os.path.join(tmp, "docs", "nested")
+            markdown = asyncio.run(AsyncNotion(client=FakeClient(count=1)).pull_page(PAGE_ID, output_dir=output_dir))
+            with open(os.path.join(output_dir, "Title.md"), encoding="utf-8") as f:
+                self.assertEqual(f.read(), markdown)
+
+    def test_fetch_children_requires_output_dir(self):
+        with self.assertRaises(ValueError):
+            asyncio.run(AsyncNotion(client=FakeClient(count=1)).pull_page(PAGE_ID, fetch_children=True))
+
+
+    def test_push_markdown_updates_page_from_url_trailer(self):
+        client = FakeClient(count=5, page_size=2)
+        markdown = f"# Heading\n\nbody\n\n//url:https://www.notion.so/{PAGE_ID}"
+        url = asyncio.run(AsyncNotion(client=client).push_markdown(markdown, "New title"))
+
+        self.assertEqual(url, f"https://www.notion.so/{PAGE_ID}")
+        self.assertEqual(client.called("pages.create"), [])
+        update, = client.called("pages.update")
+        self.assertEqual(update["page_id"], PAGE_ID)
+        self.assertEqual(update["properties"]["title"]["title"][0]["text"]["content"], "New title")
+        # ページネーションされた既存ブロックがすべてアーカイブされる
+        archived = sorted(call["block_id"] for call in client.called("blocks.update"))
+        self.assertEqual(archived, [f"p{i}" for i in range(5)])
+        self.assertTrue(all(call["archived"] for call in client.called("blocks.update")))
+        append, = client.called("blocks.children.append")
+        self.assertEqual(append["block_id"], PAGE_ID)
+        self.assertEqual([block["type"] for block in append["children"]], ["heading_1", "paragraph"])
+        self.assertNotIn("//url:", repr(append["children"]))
+
+    def test_push_markdown_creates_page_in_database_with_title_column(self):
+        client = FakeClient(count=0)
+        url = asyncio.run(AsyncNotion(client=client).push_markdown(
+            "body", "New page", parent_url=f"https://www.notion.so/{DATABASE_ID}", title_column="Name"))
+
+        self.assertEqual(url, "https://www.notion.so/new")
+        create, = client.called("pages.create")
+        self.assertEqual(create["parent"], {"database_id": DATABASE_ID})
+        self.assertEqual(list(create["properties"]), ["Name"])
+        self.assertEqual(create["properties"]["Name"]["title"][0]["text"]["content"], "New page")
+        append, = client.called("blocks.children.append")
+        self.assertEqual(append["block_id"], "new")
+
+    def test_push_markdown_falls_back_to_page_parent(self):
+        client = FakeClient(count=0)
+        asyncio.run(AsyncNotion(client=client).push_markdown(
+            "body", "New page", parent_url=f"https://www.notion.so/{PAGE_ID}", title_column="Name"))
+
+        create, = client.called("pages.create")
+        self.assertEqual(create["parent"], {"page_id": PAGE_ID})
+        self.assertEqual(list(create["properties"]), ["title"])
+
+    def test_push_markdown_requires_parent_url_without_trailer(self):
+        client = FakeClient(count=0)
+        with self.assertRaises(ValueError):
+            asyncio.run(AsyncNotion(client=client).push_markdown("body", "New page"))
+        self.assertEqual(client.calls, [])
+
+
+if __name__ == "__main__":
+    unittest.main()